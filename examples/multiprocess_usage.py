@@ -0,0 +1,72 @@
+import sys
+import os
+import time
+import multiprocessing
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pyclog import Pyclog, LogConfig, LogListener
+
+
+worker_logger = None
+
+
+def Worker_Init(client):
+    global worker_logger
+    worker_logger = client
+
+
+def Worker_Task(count: int) -> int:
+    for i in range(count):
+        worker_logger.Info(f"进程 {os.getpid()} - 消息 {i+1}", task="benchmark")
+    return count
+
+
+def Example_Multiprocess_Logging():
+    print("=== 多进程日志示例 ===")
+
+    logger = Pyclog(LogConfig(log_file_path="logs/multiprocess.log"))
+
+    with LogListener(logger) as listener:
+        pool = multiprocessing.Pool(4, initializer=Worker_Init, initargs=(listener.Get_Client(),))
+        pool.map(Worker_Task, [100] * 4)
+        pool.close()
+        pool.join()
+
+    logger.Close()
+    print("4 个进程的日志已由同一个写入线程写入 logs/multiprocess.log")
+
+
+def Example_Throughput(transport: str = "queue", records_per_worker: int = 20000):
+    print(f"\n=== 多进程吞吐量 ({transport}) ===")
+
+    for workers in (1, 2, 4, 8):
+        log_path = f"logs/throughput_{transport}.log"
+        if os.path.exists(log_path):
+            os.remove(log_path)
+
+        logger = Pyclog(LogConfig(log_file_path=log_path, max_file_size=1024 * 1024 * 1024))
+        listener = LogListener(logger, transport=transport, address="logs/throughput.sock")
+
+        start = time.perf_counter()
+        with listener:
+            pool = multiprocessing.Pool(workers, initializer=Worker_Init,
+                                        initargs=(listener.Get_Client(),))
+            pool.map(Worker_Task, [records_per_worker] * workers)
+            pool.close()
+            pool.join()
+        elapsed = time.perf_counter() - start
+        logger.Close()
+
+        total = workers * records_per_worker
+        print(f"{workers} 个进程: {total} 条日志, 用时 {elapsed:.2f} 秒, {total / elapsed:.0f} 条/秒")
+
+
+if __name__ == "__main__":
+    os.makedirs("logs", exist_ok=True)
+
+    Example_Multiprocess_Logging()
+    Example_Throughput("queue")
+    if hasattr(os, "fork"):
+        Example_Throughput("unix")
+
+    print("\n=== 所有示例运行完成 ===")
@@ -1,7 +1,11 @@
-from .core import Pyclog, Create_Logger, Get_Logger
+from .core import Pyclog, BoundPyclog, Create_Logger, Get_Logger
 from .config import LogConfig, LogLevel, LogMessage, DEFAULT_CONFIG, Validate_Config
 from .formatter import LogFormatter, SimpleFormatter, DetailedFormatter, JSONFormatter
-from .handler import FileHandler, RotatingFileHandler, ConsoleHandler
+from .handler import FileHandler, RotatingFileHandler, ConsoleHandler, SocketHandler
+from .parser import LogParser
+from .reader import LogReader
+from .multiprocess import LogListener, LogClient
+from .stats import LogStats, Discover_Log_Files, Analyze_Logs
 
 __version__ = "1.0.0"
 
@@ -13,6 +17,7 @@ def gugugaga():
 
 __all__ = [
     "Pyclog",
+    "BoundPyclog",
     "Create_Logger",
     "Get_Logger",
     "LogConfig",
@@ -27,5 +32,13 @@ __all__ = [
     "FileHandler",
     "RotatingFileHandler",
     "ConsoleHandler",
+    "SocketHandler",
+    "LogParser",
+    "LogReader",
+    "LogListener",
+    "LogClient",
+    "LogStats",
+    "Discover_Log_Files",
+    "Analyze_Logs",
     "gugugaga",
 ]
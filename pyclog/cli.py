@@ -0,0 +1,191 @@
+import argparse
+import json
+import sys
+from datetime import datetime
+from typing import Optional, List
+
+from .config import LogConfig, LogLevel, DEFAULT_CONFIG
+from .formatter import LogFormatter
+from .parser import LogParser, DEFAULT_LOG_FORMAT
+from .reader import LogReader
+from .stats import Discover_Log_Files, Analyze_Logs, LogStats
+
+
+def _Parse_Date(value: Optional[str], date_format: str) -> Optional[datetime]:
+    if value is None:
+        return None
+    try:
+        return datetime.strptime(value, date_format)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"date '{value}' does not match format '{date_format}'")
+
+
+def _Print_Stats(stats: LogStats, top: int) -> None:
+    summary = stats.To_Dict(top)
+
+    print(f"Files:    {summary['files']}")
+    print(f"Bytes:    {summary['bytes']}")
+    print(f"Lines:    {summary['total_lines']} "
+          f"(parsed {summary['parsed_lines']}, unparsed {summary['unparsed_lines']})")
+
+    print("\nLevels:")
+    for level_name, count in summary["levels"].items():
+        print(f"  {level_name:<10} {count}")
+
+    if summary["modules"]:
+        print("\nModules:")
+        for module_name, count in summary["modules"].items():
+            print(f"  {module_name:<30} {count}")
+
+    if summary["top_messages"]:
+        print(f"\nTop {top} messages:")
+        for entry in summary["top_messages"]:
+            print(f"  {entry['count']:>8}  {entry['message']}")
+
+
+def _Run_Stats(args: argparse.Namespace) -> int:
+    config = LogConfig(
+        log_file_path=args.log_file,
+        date_format=args.date_format,
+        log_format=args.format,
+        encoding=args.encoding
+    )
+
+    try:
+        since = _Parse_Date(args.since, config.date_format)
+        until = _Parse_Date(args.until, config.date_format)
+    except argparse.ArgumentTypeError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+    paths = Discover_Log_Files(config, since, until)
+    if not paths:
+        print(f"Error: no log files found for {config.log_file_path}", file=sys.stderr)
+        return 1
+
+    try:
+        stats = Analyze_Logs(
+            paths,
+            format_string=config.log_format,
+            encoding=config.encoding,
+            workers=args.workers,
+            chunk_size=args.chunk_size
+        )
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+    if args.json:
+        print(json.dumps(stats.To_Dict(args.top), ensure_ascii=False, indent=2))
+    else:
+        _Print_Stats(stats, args.top)
+    return 0
+
+
+def _Run_Tail(args: argparse.Namespace) -> int:
+    config = LogConfig(
+        log_file_path=args.log_file,
+        enable_date_rotation=args.date_rotation,
+        date_format=args.date_format,
+        log_format=args.format,
+        encoding=args.encoding
+    )
+
+    min_level = None
+    formatter = None
+    if args.level:
+        try:
+            parser = LogParser(config.log_format)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 2
+        min_level = LogLevel[args.level]
+        formatter = LogFormatter(config.log_format)
+    else:
+        parser = None
+
+    reader = LogReader(config, parser=parser, checkpoint_path=args.checkpoint)
+    if not reader.resumed:
+        reader.Seek_Last_Lines(args.lines)
+
+    try:
+        with reader:
+            if min_level is None:
+                for line in reader.Read_Lines(follow=args.follow):
+                    print(line, flush=args.follow)
+            else:
+                for message in reader.Read(follow=args.follow):
+                    if message.level.value >= min_level.value:
+                        print(formatter.Format_Message(message), flush=args.follow)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def _Build_Parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="pyclog", description="pyclog log file tools")
+    subparsers = parser.add_subparsers(dest="command")
+
+    stats_parser = subparsers.add_parser(
+        "stats",
+        help="count records per level and module across rotated and date-split log files"
+    )
+    stats_parser.add_argument("log_file",
+                              help="configured log_file_path, e.g. logs/app.log")
+    stats_parser.add_argument("--format", default=DEFAULT_LOG_FORMAT,
+                              help="format string used to write the files "
+                                   "(default: the SimpleFormatter layout)")
+    stats_parser.add_argument("--date-format", default=DEFAULT_CONFIG.date_format,
+                              help="date_format used for date-split file names")
+    stats_parser.add_argument("--encoding", default=DEFAULT_CONFIG.encoding)
+    stats_parser.add_argument("--since", help="first date to include, in --date-format")
+    stats_parser.add_argument("--until", help="last date to include, in --date-format")
+    stats_parser.add_argument("--top", type=int, default=10,
+                              help="number of most frequent messages to show")
+    stats_parser.add_argument("--workers", type=int, default=None,
+                              help="number of worker processes (default: CPU count)")
+    stats_parser.add_argument("--chunk-size", type=int, default=None,
+                              help="bytes per work unit (default: sized to the worker count)")
+    stats_parser.add_argument("--json", action="store_true", help="print the result as JSON")
+    stats_parser.set_defaults(func=_Run_Stats)
+
+    tail_parser = subparsers.add_parser(
+        "tail",
+        help="print the end of a log file, following it across rotations with -f"
+    )
+    tail_parser.add_argument("log_file",
+                             help="configured log_file_path, e.g. logs/app.log")
+    tail_parser.add_argument("-f", "--follow", action="store_true",
+                             help="keep reading as the file grows and rotates")
+    tail_parser.add_argument("-n", "--lines", type=int, default=10,
+                             help="number of existing lines to print first")
+    tail_parser.add_argument("--level", choices=[level.name for level in LogLevel],
+                             help="only print records at or above this level")
+    tail_parser.add_argument("--date-rotation", action="store_true",
+                             help="the logger writes date-split files (enable_date_rotation)")
+    tail_parser.add_argument("--format", default=DEFAULT_LOG_FORMAT,
+                             help="format string used to write the file "
+                                  "(default: the SimpleFormatter layout)")
+    tail_parser.add_argument("--date-format", default=DEFAULT_CONFIG.date_format,
+                             help="date_format used for date-split file names")
+    tail_parser.add_argument("--encoding", default=DEFAULT_CONFIG.encoding)
+    tail_parser.add_argument("--checkpoint",
+                             help="file that stores the read position to resume from")
+    tail_parser.set_defaults(func=_Run_Tail)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = _Build_Parser()
+    args = parser.parse_args(argv)
+
+    if not getattr(args, "func", None):
+        parser.print_help()
+        return 1
+
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
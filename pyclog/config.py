@@ -32,6 +32,7 @@ class LogMessage:
     module_name: str
     timestamp: str
     extra_fields: dict = field(default_factory=dict)
+    created: Optional[float] = None
 
 
 DEFAULT_CONFIG = LogConfig(
@@ -1,25 +1,85 @@
 import inspect
+import weakref
+from dataclasses import replace
 from datetime import datetime
-from typing import Optional, List, Any
+from typing import Optional, List, Any, Dict, Tuple
 
 from .config import LogConfig, LogMessage, LogLevel, DEFAULT_CONFIG
 from .formatter import LogFormatter, SimpleFormatter
 from .handler import FileHandler, RotatingFileHandler, ConsoleHandler
 
 
+class _HandlerList(list):
+    def __init__(self, owner: "Pyclog", handlers: Any = ()):
+        super().__init__(handlers)
+        self._owner = weakref.ref(owner)
+
+    def _Changed(self) -> None:
+        owner = self._owner()
+        if owner is not None:
+            owner._Update_Min_Handler_Level()
+
+    def append(self, handler: Any) -> None:
+        super().append(handler)
+        self._Changed()
+
+    def extend(self, handlers: Any) -> None:
+        super().extend(handlers)
+        self._Changed()
+
+    def insert(self, index: int, handler: Any) -> None:
+        super().insert(index, handler)
+        self._Changed()
+
+    def remove(self, handler: Any) -> None:
+        super().remove(handler)
+        self._Changed()
+
+    def pop(self, index: int = -1) -> Any:
+        handler = super().pop(index)
+        self._Changed()
+        return handler
+
+    def clear(self) -> None:
+        super().clear()
+        self._Changed()
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        super().__setitem__(index, value)
+        self._Changed()
+
+    def __delitem__(self, index: Any) -> None:
+        super().__delitem__(index)
+        self._Changed()
+
+    def __iadd__(self, handlers: Any) -> "_HandlerList":
+        self.extend(handlers)
+        return self
+
+
 class Pyclog:
     def __init__(self, config: Optional[LogConfig] = None, 
                  formatter: Optional[LogFormatter] = None):
         self.config = config or DEFAULT_CONFIG
         self.formatter = formatter or SimpleFormatter()
-        self.handlers: List[Any] = []
+        self._handlers: List[Any] = _HandlerList(self)
         self._lock = False
+        self._min_handler_value = 0
         
         self._Initialize_Handlers()
 
+    @property
+    def handlers(self) -> List[Any]:
+        return self._handlers
+
+    @handlers.setter
+    def handlers(self, value: List[Any]) -> None:
+        self._handlers = _HandlerList(self, value)
+        self._Update_Min_Handler_Level()
+
     def _Initialize_Handlers(self) -> None:
         file_handler = RotatingFileHandler(self.config, self.formatter)
-        self.handlers.append(file_handler)
+        self.Add_Handler(file_handler)
 
     def Add_Handler(self, handler: Any) -> None:
         self.handlers.append(handler)
@@ -40,6 +100,9 @@ class Pyclog:
     def Set_Log_Level(self, level: LogLevel) -> None:
         self.config.min_log_level = level
 
+    def Bind(self, **context) -> "BoundPyclog":
+        return BoundPyclog(self, context)
+
     def Debug(self, message: str, **kwargs) -> bool:
         return self._Log(LogLevel.DEBUG, message, **kwargs)
 
@@ -55,30 +118,111 @@ class Pyclog:
     def Critical(self, message: str, **kwargs) -> bool:
         return self._Log(LogLevel.CRITICAL, message, **kwargs)
 
+    def Get_Min_Enabled_Level(self) -> LogLevel:
+        return LogLevel(max(self.config.min_log_level.value, self._min_handler_value))
+
+    def _Update_Min_Handler_Level(self) -> None:
+        handler_levels = []
+        for handler in self.handlers:
+            loggers = getattr(handler, "_loggers", None)
+            if loggers is None:
+                loggers = weakref.WeakSet()
+                handler._loggers = loggers
+            loggers.add(self)
+            handler_levels.append(getattr(handler, "level", None))
+        
+        if handler_levels and None not in handler_levels:
+            self._min_handler_value = min(handler_level.value for handler_level in handler_levels)
+        else:
+            self._min_handler_value = 0
+
     def _Log(self, level: LogLevel, message: str, **kwargs) -> bool:
-        if level.value < self.config.min_log_level.value:
+        if level.value < max(self.config.min_log_level.value, self._min_handler_value):
             return False
         
-        timestamp = self.formatter.Format_Timestamp()
+        created = datetime.now()
         module_name = self._Get_Calling_Module_Name()
         
         log_message = LogMessage(
             level=level,
             message=message,
             module_name=module_name,
-            timestamp=timestamp,
+            timestamp="",
             extra_fields=kwargs
         )
         
-        formatted_message = self.formatter.Format_Message(log_message)
-        
+        rendered_messages: Dict[int, str] = {}
         success = True
         for handler in self.handlers:
+            if not self._Handler_Accepts(handler, level):
+                continue
+            
+            formatter = self._Get_Handler_Formatter(handler)
+            formatted_message = rendered_messages.get(id(formatter))
+            if formatted_message is None:
+                log_message.timestamp = self._Format_Timestamp(formatter, created)
+                formatted_message = self._Render(formatter, log_message)
+                rendered_messages[id(formatter)] = formatted_message
+            
             if not handler.Write_Log(formatted_message):
                 success = False
         
         return success
 
+    def Log_Messages(self, messages: List[LogMessage]) -> bool:
+        min_value = max(self.config.min_log_level.value, self._min_handler_value)
+        messages = [message for message in messages if message.level.value >= min_value]
+        created_times = [
+            datetime.fromtimestamp(message.created) if message.created is not None else None
+            for message in messages
+        ]
+        rendered_messages: Dict[int, Dict[int, str]] = {}
+        success = True
+        for handler in self.handlers:
+            formatter = self._Get_Handler_Formatter(handler)
+            formatter_cache = rendered_messages.setdefault(id(formatter), {})
+            
+            formatted_messages = []
+            for index, message in enumerate(messages):
+                if not self._Handler_Accepts(handler, message.level):
+                    continue
+                formatted_message = formatter_cache.get(index)
+                if formatted_message is None:
+                    if created_times[index] is not None:
+                        message.timestamp = self._Format_Timestamp(formatter, created_times[index])
+                    formatted_message = self._Render(formatter, message)
+                    formatter_cache[index] = formatted_message
+                formatted_messages.append(formatted_message)
+            
+            if not formatted_messages:
+                continue
+            
+            write_logs = getattr(handler, "Write_Logs", None)
+            if write_logs is not None:
+                handler_success = write_logs(formatted_messages)
+            else:
+                handler_success = all([handler.Write_Log(message) for message in formatted_messages])
+            if not handler_success:
+                success = False
+        
+        return success
+
+    def _Handler_Accepts(self, handler: Any, level: LogLevel) -> bool:
+        handler_level = getattr(handler, "level", None)
+        return handler_level is None or level.value >= handler_level.value
+
+    def _Get_Handler_Formatter(self, handler: Any) -> LogFormatter:
+        return getattr(handler, "formatter", None) or self.formatter
+
+    def _Format_Timestamp(self, formatter: LogFormatter, created: datetime) -> str:
+        format_timestamp = getattr(formatter, "Format_Timestamp", None)
+        if format_timestamp is None:
+            return created.strftime(getattr(formatter, "time_format", "%Y-%m-%d %H:%M:%S"))
+        return format_timestamp(created)
+
+    def _Render(self, formatter: LogFormatter, message: LogMessage) -> str:
+        return formatter.Format_Message(message)
+
     def _Get_Calling_Module_Name(self) -> str:
         try:
             frame = inspect.currentframe()
@@ -105,7 +249,9 @@ class Pyclog:
 
     def Create_Log_File(self, file_path: str, 
                        max_size: Optional[int] = None,
-                       backup_count: Optional[int] = None) -> bool:
+                       backup_count: Optional[int] = None,
+                       formatter: Optional[LogFormatter] = None,
+                       level: Optional[LogLevel] = None) -> bool:
         try:
             from copy import deepcopy
             
@@ -117,16 +263,17 @@ class Pyclog:
             if backup_count is not None:
                 new_config.backup_count = backup_count
             
-            new_handler = RotatingFileHandler(new_config, self.formatter)
-            self.handlers.append(new_handler)
+            new_handler = RotatingFileHandler(new_config, formatter or self.formatter, level)
+            self.Add_Handler(new_handler)
             return True
         except Exception as e:
             print(f"Error creating log file: {e}")
             return False
 
-    def Add_Console_Output(self) -> None:
-        console_handler = ConsoleHandler(self.formatter)
-        self.handlers.append(console_handler)
+    def Add_Console_Output(self, formatter: Optional[LogFormatter] = None,
+                           level: Optional[LogLevel] = None) -> None:
+        console_handler = ConsoleHandler(formatter or self.formatter, level)
+        self.Add_Handler(console_handler)
 
     def Flush(self) -> None:
         for handler in self.handlers:
@@ -144,6 +291,67 @@ class Pyclog:
         return False
 
 
+class BoundPyclog(Pyclog):
+    def __init__(self, parent: Pyclog, context: Dict[str, Any]):
+        self._parent = parent
+        self.context = context
+        self._rendered_context: Dict[int, Tuple[Any, Any, Any]] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "_parent":
+            raise AttributeError(name)
+        return getattr(self._parent, name)
+
+    @property
+    def config(self) -> LogConfig:
+        return self._parent.config
+
+    @config.setter
+    def config(self, value: LogConfig) -> None:
+        self._parent.config = value
+
+    @property
+    def formatter(self) -> LogFormatter:
+        return self._parent.formatter
+
+    @formatter.setter
+    def formatter(self, value: LogFormatter) -> None:
+        self._parent.formatter = value
+
+    @property
+    def handlers(self) -> List[Any]:
+        return self._parent.handlers
+
+    @handlers.setter
+    def handlers(self, value: List[Any]) -> None:
+        self._parent.handlers = value
+
+    def Bind(self, **context) -> "BoundPyclog":
+        return BoundPyclog(self._parent, {**self.context, **context})
+
+    def Close(self) -> None:
+        pass
+
+    def _Render(self, formatter: LogFormatter, message: LogMessage) -> str:
+        rendered_context = self._Get_Rendered_Context(formatter)
+        if rendered_context is not None and self.context.keys().isdisjoint(message.extra_fields):
+            formatted_message = formatter.Format_Bound(message, rendered_context)
+            if formatted_message is not None:
+                return formatted_message
+        merged_message = replace(message, extra_fields={**self.context, **message.extra_fields})
+        return formatter.Format_Message(merged_message)
+
+    def _Get_Rendered_Context(self, formatter: LogFormatter) -> Any:
+        format_string = getattr(formatter, "format_string", None)
+        entry = self._rendered_context.get(id(formatter))
+        if entry is None or entry[0] is not formatter or entry[1] != format_string:
+            render_context = getattr(formatter, "Render_Context", None)
+            rendered_context = render_context(self.context) if render_context is not None else None
+            entry = (formatter, format_string, rendered_context)
+            self._rendered_context[id(formatter)] = entry
+        return entry[2]
+
+
 def Create_Logger(log_file_path: str = "app.log",
                   max_file_size: int = 10 * 1024 * 1024,
                   backup_count: int = 5,
@@ -1,5 +1,6 @@
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+import json
 import re
 
 from .config import LogMessage, LogLevel
@@ -13,8 +14,30 @@ class LogFormatter:
         self._pattern = re.compile(r"%\((\w+)\)s")
 
     def Format_Message(self, message: LogMessage) -> str:
+        return self._Render(self.format_string, message)
+
+    def Render_Context(self, context: Dict[str, Any]) -> Optional[str]:
+        if type(self).Format_Message is not LogFormatter.Format_Message:
+            return None
+        values = {key: str(value) for key, value in context.items()}
+        if any("%" in value for value in values.values()):
+            return None
+        
+        rendered_format = self.format_string
+        for key, value in values.items():
+            rendered_format = rendered_format.replace(f"%({key})s", value)
+        return rendered_format
+
+    def Format_Bound(self, message: LogMessage, rendered_context: str) -> Optional[str]:
+        if "%(" in message.message:
+            return None
+        if any("%(" in str(value) for value in message.extra_fields.values()):
+            return None
+        return self._Render(rendered_context, message)
+
+    def _Render(self, format_string: str, message: LogMessage) -> str:
         format_dict = self._Build_Format_Dict(message)
-        formatted_message = self.format_string
+        formatted_message = format_string
         
         for key, value in format_dict.items():
             placeholder = f"%({key})s"
@@ -62,11 +85,12 @@ class DetailedFormatter(LogFormatter):
 
 
 class JSONFormatter:
+    _RESERVED_KEYS = ("timestamp", "level", "level_value", "module", "message")
+
     def __init__(self, time_format: str = "%Y-%m-%dT%H:%M:%S"):
         self.time_format = time_format
 
     def Format_Message(self, message: LogMessage) -> str:
-        import json
         log_dict = {
             "timestamp": message.timestamp,
             "level": message.level.name,
@@ -79,3 +103,21 @@ class JSONFormatter:
             log_dict.update(message.extra_fields)
         
         return json.dumps(log_dict, ensure_ascii=False)
+
+    def Format_Timestamp(self, timestamp: datetime = None) -> str:
+        if timestamp is None:
+            timestamp = datetime.now()
+        return timestamp.strftime(self.time_format)
+
+    def Render_Context(self, context: Dict[str, Any]) -> Optional[str]:
+        if type(self).Format_Message is not JSONFormatter.Format_Message:
+            return None
+        if any(key in context for key in self._RESERVED_KEYS):
+            return None
+        return json.dumps(context, ensure_ascii=False)[1:-1]
+
+    def Format_Bound(self, message: LogMessage, rendered_context: str) -> Optional[str]:
+        formatted_message = self.Format_Message(message)
+        if not rendered_context:
+            return formatted_message
+        return f"{formatted_message[:-1]}, {rendered_context}}}"
@@ -1,18 +1,31 @@
+import errno
 import os
+import queue
+import select
+import socket
+import struct
 import threading
+import time
 from datetime import datetime
-from typing import Optional
+from typing import Optional, List
 from pathlib import Path
 
-from .config import LogConfig, Validate_Config
+from .config import LogConfig, LogLevel, Validate_Config
 from .formatter import LogFormatter
 
 
+def _Notify_Level_Change(handler) -> None:
+    for logger in list(getattr(handler, "_loggers", ())):
+        logger._Update_Min_Handler_Level()
+
+
 class FileHandler:
-    def __init__(self, config: LogConfig, formatter: LogFormatter):
+    def __init__(self, config: LogConfig, formatter: LogFormatter,
+                 level: Optional[LogLevel] = None):
         Validate_Config(config)
         self.config = config
         self.formatter = formatter
+        self.level = level
         self._lock = threading.Lock()
         self._current_file_path = self._Get_Current_File_Path()
         
@@ -30,6 +43,17 @@ class FileHandler:
             print(f"Error writing log: {e}")
             return False
 
+    def Write_Logs(self, messages: List[str]) -> bool:
+        try:
+            with self._lock:
+                self._Check_And_Perform_Rotation()
+                with open(self._current_file_path, 'a', encoding=self.config.encoding) as f:
+                    f.write('\n'.join(messages) + '\n')
+                return True
+        except Exception as e:
+            print(f"Error writing log: {e}")
+            return False
+
     def _Create_Directory_If_Not_Exists(self) -> None:
         log_dir = os.path.dirname(self._current_file_path)
         if log_dir and not os.path.exists(log_dir):
@@ -87,6 +111,10 @@ class FileHandler:
     def Get_Log_File_Path(self) -> str:
         return self._current_file_path
 
+    def Set_Level(self, level: Optional[LogLevel]) -> None:
+        self.level = level
+        _Notify_Level_Change(self)
+
     def Flush(self) -> None:
         pass
 
@@ -95,8 +123,9 @@ class FileHandler:
 
 
 class RotatingFileHandler(FileHandler):
-    def __init__(self, config: LogConfig, formatter: LogFormatter):
-        super().__init__(config, formatter)
+    def __init__(self, config: LogConfig, formatter: LogFormatter,
+                 level: Optional[LogLevel] = None):
+        super().__init__(config, formatter, level)
         self._file_handle = None
         self._Open_File()
 
@@ -120,6 +149,18 @@ class RotatingFileHandler(FileHandler):
             print(f"Error writing log: {e}")
             return False
 
+    def Write_Logs(self, messages: List[str]) -> bool:
+        try:
+            with self._lock:
+                self._Check_And_Perform_Rotation()
+                if self._file_handle:
+                    self._file_handle.write('\n'.join(messages) + '\n')
+                    self._file_handle.flush()
+                return True
+        except Exception as e:
+            print(f"Error writing log: {e}")
+            return False
+
     def _Check_Size_Rotation(self) -> None:
         if not os.path.exists(self._current_file_path):
             return
@@ -157,8 +198,9 @@ class RotatingFileHandler(FileHandler):
 
 
 class ConsoleHandler:
-    def __init__(self, formatter: LogFormatter):
+    def __init__(self, formatter: LogFormatter, level: Optional[LogLevel] = None):
         self.formatter = formatter
+        self.level = level
         self._lock = threading.Lock()
 
     def Write_Log(self, message: str) -> bool:
@@ -170,8 +212,364 @@ class ConsoleHandler:
             print(f"Error writing to console: {e}")
             return False
 
+    def Write_Logs(self, messages: List[str]) -> bool:
+        try:
+            with self._lock:
+                print('\n'.join(messages))
+                return True
+        except Exception as e:
+            print(f"Error writing to console: {e}")
+            return False
+
+    def Set_Level(self, level: Optional[LogLevel]) -> None:
+        self.level = level
+        _Notify_Level_Change(self)
+
     def Flush(self) -> None:
         pass
 
     def Close(self) -> None:
         pass
+
+
+class SocketHandler:
+    PROTOCOLS = ("tcp", "udp", "unix")
+    FRAMINGS = ("newline", "length")
+
+    _LENGTH_PREFIX = struct.Struct("!I")
+    _CLOSE = object()
+
+    def __init__(self, formatter: LogFormatter,
+                 host: str = "localhost",
+                 port: int = 0,
+                 protocol: str = "tcp",
+                 framing: str = "newline",
+                 unix_path: Optional[str] = None,
+                 batch_size: int = 100,
+                 flush_interval: float = 0.5,
+                 spool_path: Optional[str] = None,
+                 max_spool_size: int = 100 * 1024 * 1024,
+                 max_queue_size: int = 10000,
+                 max_backoff: float = 30.0,
+                 max_datagram_size: int = 8192,
+                 timeout: float = 5.0,
+                 encoding: str = "utf-8",
+                 level: Optional[LogLevel] = None):
+        if protocol not in self.PROTOCOLS:
+            raise ValueError(f"protocol must be one of {self.PROTOCOLS}")
+        if framing not in self.FRAMINGS:
+            raise ValueError(f"framing must be one of {self.FRAMINGS}")
+        if protocol == "unix" and not unix_path:
+            raise ValueError("unix_path is required for the unix protocol")
+        if protocol != "unix" and not port:
+            raise ValueError("port is required for the tcp and udp protocols")
+        if batch_size <= 0:
+            raise ValueError("batch_size must be greater than 0")
+        if max_datagram_size <= self._LENGTH_PREFIX.size:
+            raise ValueError("max_datagram_size is too small")
+
+        self.formatter = formatter
+        self.level = level
+        self.host = host
+        self.port = port
+        self.protocol = protocol
+        self.framing = framing
+        self.unix_path = unix_path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.spool_path = spool_path
+        self.max_spool_size = max_spool_size
+        self.max_backoff = max_backoff
+        self.max_datagram_size = max_datagram_size
+        self.timeout = timeout
+        self.encoding = encoding
+
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._socket = None
+        self._backoff = 0.0
+        self._next_connect_time = 0.0
+        self._closed = False
+        self._spool_pending = bool(spool_path) and os.path.exists(spool_path)
+
+        self._thread = threading.Thread(target=self._Sender_Loop,
+                                        name="pyclog-socket-handler",
+                                        daemon=True)
+        self._thread.start()
+
+    def Write_Log(self, message: str) -> bool:
+        if self._closed:
+            return False
+        try:
+            self._queue.put_nowait(message)
+            return True
+        except queue.Full:
+            print("Error writing log: socket handler queue is full")
+            return False
+
+    def Write_Logs(self, messages: List[str]) -> bool:
+        success = True
+        for message in messages:
+            if not self.Write_Log(message):
+                success = False
+        return success
+
+    def Set_Level(self, level: Optional[LogLevel]) -> None:
+        self.level = level
+        _Notify_Level_Change(self)
+
+    def Flush(self) -> None:
+        if self._closed or not self._thread.is_alive():
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait()
+
+    def Close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        if self._thread.is_alive():
+            self._queue.put(self._CLOSE)
+            self._thread.join()
+
+    def _Sender_Loop(self) -> None:
+        running = True
+        while running:
+            batch, markers, running = self._Collect_Batch()
+            try:
+                if batch:
+                    self._Send_Batch(batch)
+                elif self._spool_pending and self._Ensure_Connected():
+                    self._Replay_Spool()
+            except Exception as e:
+                print(f"Error sending logs: {e}")
+            for marker in markers:
+                marker.set()
+        self._Close_Socket()
+
+    def _Collect_Batch(self):
+        batch: List[str] = []
+        markers: List[threading.Event] = []
+        try:
+            item = self._queue.get(timeout=self.flush_interval)
+        except queue.Empty:
+            return batch, markers, True
+
+        while True:
+            if item is self._CLOSE:
+                return batch, markers, False
+            if isinstance(item, threading.Event):
+                markers.append(item)
+                return batch, markers, True
+            batch.append(item)
+            if len(batch) >= self.batch_size:
+                return batch, markers, True
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return batch, markers, True
+
+    def _Send_Batch(self, batch: List[str]) -> None:
+        payloads = [message.encode(self.encoding, errors="replace") for message in batch]
+        if self._Ensure_Connected():
+            if self._Replay_Spool() and self._Send_Payloads(payloads):
+                return
+        self._Spool(payloads)
+
+    def _Ensure_Connected(self) -> bool:
+        if self._socket is not None:
+            if self._Is_Connection_Alive():
+                return True
+            self._Close_Socket()
+
+        if time.monotonic() < self._next_connect_time:
+            return False
+
+        try:
+            self._socket = self._Create_Socket()
+            self._backoff = 0.0
+            return True
+        except OSError as e:
+            print(f"Error connecting to log collector: {e}")
+            self._Schedule_Reconnect()
+            return False
+
+    def _Create_Socket(self) -> socket.socket:
+        if self.protocol == "unix":
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            address = self.unix_path
+        else:
+            sock_type = socket.SOCK_DGRAM if self.protocol == "udp" else socket.SOCK_STREAM
+            family, _, _, _, address = socket.getaddrinfo(self.host, self.port, 0, sock_type)[0]
+            sock = socket.socket(family, sock_type)
+
+        try:
+            sock.settimeout(self.timeout)
+            sock.connect(address)
+            if self.protocol == "tcp":
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        except OSError:
+            sock.close()
+            raise
+        return sock
+
+    def _Is_Connection_Alive(self) -> bool:
+        if self.protocol == "udp":
+            return True
+        try:
+            readable, _, _ = select.select([self._socket], [], [], 0)
+            if readable and not self._socket.recv(1, socket.MSG_PEEK):
+                return False
+            return True
+        except OSError:
+            return False
+
+    def _Schedule_Reconnect(self) -> None:
+        self._backoff = min(max(self._backoff * 2, 0.5), self.max_backoff)
+        self._next_connect_time = time.monotonic() + self._backoff
+
+    def _Close_Socket(self) -> None:
+        if self._socket is not None:
+            try:
+                self._socket.close()
+            except OSError:
+                pass
+            finally:
+                self._socket = None
+
+    def _Frame(self, payload: bytes) -> bytes:
+        if self.framing == "length":
+            return self._LENGTH_PREFIX.pack(len(payload)) + payload
+        return payload + b"\n"
+
+    def _Fit_Datagram(self, payload: bytes) -> bytes:
+        overhead = self._LENGTH_PREFIX.size if self.framing == "length" else 1
+        limit = self.max_datagram_size - overhead
+        if len(payload) <= limit:
+            return payload
+        print(f"Error sending logs: record of {len(payload)} bytes exceeds "
+              f"max_datagram_size, truncated to {limit} bytes")
+        return payload[:limit].decode(self.encoding, errors="ignore").encode(self.encoding)
+
+    def _Build_Packets(self, payloads: List[bytes]) -> List[List[bytes]]:
+        if self.protocol != "udp":
+            return [[self._Frame(payload) for payload in payloads]]
+
+        frames = [self._Frame(self._Fit_Datagram(payload)) for payload in payloads]
+        packets = []
+        current: List[bytes] = []
+        current_size = 0
+        for frame in frames:
+            if current and current_size + len(frame) > self.max_datagram_size:
+                packets.append(current)
+                current = []
+                current_size = 0
+            current.append(frame)
+            current_size += len(frame)
+        if current:
+            packets.append(current)
+        return packets
+
+    def _Send_Payloads(self, payloads: List[bytes]) -> bool:
+        try:
+            for frames in self._Build_Packets(payloads):
+                if self.protocol == "udp":
+                    self._Send_Datagram(frames)
+                else:
+                    self._socket.sendall(b"".join(frames))
+            return True
+        except OSError as e:
+            print(f"Error sending logs: {e}")
+            self._Close_Socket()
+            self._Schedule_Reconnect()
+            return False
+
+    def _Send_Datagram(self, frames: List[bytes]) -> None:
+        try:
+            self._socket.send(b"".join(frames))
+            return
+        except OSError as e:
+            if e.errno != errno.EMSGSIZE:
+                raise
+
+        for frame in frames:
+            try:
+                self._socket.send(frame)
+            except OSError as e:
+                if e.errno != errno.EMSGSIZE:
+                    raise
+                print(f"Error sending logs: datagram of {len(frame)} bytes is too large, dropped")
+
+    def _Spool(self, payloads: List[bytes]) -> None:
+        if not self.spool_path:
+            print(f"Error sending logs: log collector unavailable, dropped {len(payloads)} records")
+            return
+        try:
+            spool_size = os.path.getsize(self.spool_path) if os.path.exists(self.spool_path) else 0
+            with open(self.spool_path, 'ab') as f:
+                for payload in payloads:
+                    record = self._LENGTH_PREFIX.pack(len(payload)) + payload
+                    if self.max_spool_size > 0 and spool_size + len(record) > self.max_spool_size:
+                        print("Error spooling logs: spool file is full, dropping records")
+                        break
+                    f.write(record)
+                    spool_size += len(record)
+            self._spool_pending = True
+        except Exception as e:
+            print(f"Error spooling logs: {e}")
+
+    def _Read_Spool_Batch(self, f) -> List[bytes]:
+        payloads = []
+        while len(payloads) < self.batch_size:
+            header = f.read(self._LENGTH_PREFIX.size)
+            if len(header) < self._LENGTH_PREFIX.size:
+                break
+            length, = self._LENGTH_PREFIX.unpack(header)
+            payload = f.read(length)
+            if len(payload) < length:
+                break
+            payloads.append(payload)
+        return payloads
+
+    def _Replay_Spool(self) -> bool:
+        if not self._spool_pending:
+            return True
+        try:
+            sent_offset = None
+            with open(self.spool_path, 'rb') as f:
+                offset = 0
+                while True:
+                    payloads = self._Read_Spool_Batch(f)
+                    if not payloads:
+                        break
+                    if not self._Send_Payloads(payloads):
+                        sent_offset = offset
+                        break
+                    offset = f.tell()
+
+            if sent_offset is not None:
+                self._Discard_Spool_Head(sent_offset)
+                return False
+
+            os.remove(self.spool_path)
+            self._spool_pending = False
+            return True
+        except FileNotFoundError:
+            self._spool_pending = False
+            return True
+        except Exception as e:
+            print(f"Error replaying spooled logs: {e}")
+            return False
+
+    def _Discard_Spool_Head(self, offset: int) -> None:
+        if offset == 0:
+            return
+        temp_path = f"{self.spool_path}.tmp"
+        with open(self.spool_path, 'rb') as src, open(temp_path, 'wb') as dst:
+            src.seek(offset)
+            while True:
+                chunk = src.read(64 * 1024)
+                if not chunk:
+                    break
+                dst.write(chunk)
+        os.replace(temp_path, self.spool_path)
@@ -0,0 +1,337 @@
+import json
+import multiprocessing
+import os
+import queue
+import selectors
+import socket
+import struct
+import threading
+import time
+from typing import Optional, List, Any, Tuple, Dict
+
+from .config import LogLevel, LogMessage
+from .core import Pyclog
+
+
+_LENGTH_PREFIX = struct.Struct("!I")
+_JSON_SCALARS = (str, int, float, bool)
+
+
+def _Encode_Frame(record: Tuple) -> bytes:
+    payload = json.dumps(record, ensure_ascii=False, default=str).encode("utf-8")
+    return _LENGTH_PREFIX.pack(len(payload)) + payload
+
+
+def _Normalize_Fields(fields: Dict[str, Any]) -> Dict[str, Any]:
+    normalized = {}
+    for key, value in fields.items():
+        if value is None or isinstance(value, _JSON_SCALARS):
+            normalized[key] = value
+        else:
+            normalized[key] = json.loads(json.dumps(value, ensure_ascii=False, default=str))
+    return normalized
+
+
+def _To_Log_Message(record: Tuple) -> LogMessage:
+    level_value, message, module_name, created, extra_fields = record
+    return LogMessage(
+        level=LogLevel(level_value),
+        message=message,
+        module_name=module_name,
+        timestamp="",
+        extra_fields=extra_fields,
+        created=created
+    )
+
+
+class LogClient:
+    TRANSPORTS = ("queue", "unix")
+
+    _Get_Calling_Module_Name = Pyclog._Get_Calling_Module_Name
+
+    def __init__(self, transport: str,
+                 log_queue: Any = None,
+                 address: Optional[str] = None,
+                 min_log_level: LogLevel = LogLevel.DEBUG):
+        if transport not in self.TRANSPORTS:
+            raise ValueError(f"transport must be one of {self.TRANSPORTS}")
+        self.transport = transport
+        self.min_log_level = min_log_level
+        self._queue = log_queue
+        self._address = address
+        self._Reset()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_lock"] = None
+        state["_socket"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._Reset()
+
+    def _Reset(self) -> None:
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._socket = None
+
+    def _Check_Fork(self) -> None:
+        if self._pid == os.getpid():
+            return
+        inherited_socket = self._socket
+        self._Reset()
+        if inherited_socket is not None:
+            try:
+                inherited_socket.close()
+            except OSError:
+                pass
+
+    def Set_Log_Level(self, level: LogLevel) -> None:
+        self.min_log_level = level
+
+    def Debug(self, message: str, **kwargs) -> bool:
+        return self._Log(LogLevel.DEBUG, message, **kwargs)
+
+    def Info(self, message: str, **kwargs) -> bool:
+        return self._Log(LogLevel.INFO, message, **kwargs)
+
+    def Warning(self, message: str, **kwargs) -> bool:
+        return self._Log(LogLevel.WARNING, message, **kwargs)
+
+    def Error(self, message: str, **kwargs) -> bool:
+        return self._Log(LogLevel.ERROR, message, **kwargs)
+
+    def Critical(self, message: str, **kwargs) -> bool:
+        return self._Log(LogLevel.CRITICAL, message, **kwargs)
+
+    def _Log(self, level: LogLevel, message: str, **kwargs) -> bool:
+        if level.value < self.min_log_level.value:
+            return False
+
+        self._Check_Fork()
+        module_name = self._Get_Calling_Module_Name()
+
+        try:
+            record = (
+                level.value,
+                str(message),
+                module_name,
+                time.time(),
+                _Normalize_Fields(kwargs)
+            )
+            if self.transport == "queue":
+                self._queue.put(record)
+            else:
+                self._Send(_Encode_Frame(record))
+            return True
+        except Exception as e:
+            print(f"Error sending log to listener: {e}")
+            return False
+
+    def _Send(self, frame: bytes) -> None:
+        with self._lock:
+            if self._socket is None:
+                sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                try:
+                    sock.connect(self._address)
+                except OSError:
+                    sock.close()
+                    raise
+                self._socket = sock
+            try:
+                self._socket.sendall(frame)
+            except OSError:
+                self._socket.close()
+                self._socket = None
+                raise
+
+    def Close(self) -> None:
+        self._Check_Fork()
+        with self._lock:
+            if self._socket is not None:
+                try:
+                    self._socket.close()
+                except OSError:
+                    pass
+                finally:
+                    self._socket = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.Close()
+        return False
+
+
+class LogListener:
+    TRANSPORTS = LogClient.TRANSPORTS
+
+    def __init__(self, logger: Pyclog,
+                 transport: str = "queue",
+                 address: Optional[str] = None,
+                 batch_size: int = 500,
+                 flush_interval: float = 0.1):
+        if transport not in self.TRANSPORTS:
+            raise ValueError(f"transport must be one of {self.TRANSPORTS}")
+        if transport == "unix" and not address:
+            raise ValueError("address is required for the unix transport")
+        if batch_size <= 0:
+            raise ValueError("batch_size must be greater than 0")
+
+        self.logger = logger
+        self.transport = transport
+        self.address = address
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self._queue = multiprocessing.Queue() if transport == "queue" else None
+        self._server = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+
+    def Get_Client(self) -> LogClient:
+        return LogClient(
+            self.transport,
+            log_queue=self._queue,
+            address=self.address,
+            min_log_level=self.logger.Get_Min_Enabled_Level()
+        )
+
+    def Start(self) -> None:
+        if self._thread is not None:
+            return
+
+        if self.transport == "unix":
+            if os.path.exists(self.address):
+                os.remove(self.address)
+            self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._server.bind(self.address)
+            self._server.listen()
+            self._server.setblocking(False)
+            target = self._Socket_Loop
+        else:
+            target = self._Queue_Loop
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=target, name="pyclog-log-listener", daemon=True)
+        self._thread.start()
+
+    def Stop(self) -> None:
+        if self._thread is None:
+            return
+
+        self._stop_event.set()
+        if self.transport == "queue":
+            self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+            if os.path.exists(self.address):
+                os.remove(self.address)
+
+        self.logger.Flush()
+
+    def __enter__(self):
+        self.Start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.Stop()
+        return False
+
+    def _Write_Batch(self, records: List[Tuple]) -> None:
+        try:
+            self.logger.Log_Messages([_To_Log_Message(record) for record in records])
+        except Exception as e:
+            print(f"Error writing log batch: {e}")
+
+    def _Queue_Loop(self) -> None:
+        running = True
+        while running:
+            try:
+                record = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+
+            records = []
+            while True:
+                if record is None:
+                    running = False
+                    break
+                records.append(record)
+                if len(records) >= self.batch_size:
+                    break
+                try:
+                    record = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            if records:
+                self._Write_Batch(records)
+
+    def _Socket_Loop(self) -> None:
+        selector = selectors.DefaultSelector()
+        selector.register(self._server, selectors.EVENT_READ)
+        buffers = {}
+
+        try:
+            while True:
+                stopping = self._stop_event.is_set()
+                records = []
+                events = selector.select(0 if stopping else self.flush_interval)
+                for key, _ in events:
+                    if key.fileobj is self._server:
+                        self._Accept(selector, buffers)
+                    else:
+                        self._Receive(key.fileobj, selector, buffers, records)
+                for start in range(0, len(records), self.batch_size):
+                    self._Write_Batch(records[start:start + self.batch_size])
+                if stopping and not events:
+                    break
+        finally:
+            for connection in buffers:
+                selector.unregister(connection)
+                connection.close()
+            selector.close()
+
+    def _Accept(self, selector, buffers) -> None:
+        try:
+            connection, _ = self._server.accept()
+        except BlockingIOError:
+            return
+        connection.setblocking(False)
+        selector.register(connection, selectors.EVENT_READ)
+        buffers[connection] = b""
+
+    def _Receive(self, connection, selector, buffers, records: List[Tuple]) -> None:
+        try:
+            data = connection.recv(256 * 1024)
+        except BlockingIOError:
+            return
+        except OSError:
+            data = b""
+
+        if not data:
+            selector.unregister(connection)
+            connection.close()
+            del buffers[connection]
+            return
+
+        buffer = buffers[connection] + data
+        position = 0
+        while len(buffer) - position >= _LENGTH_PREFIX.size:
+            length, = _LENGTH_PREFIX.unpack_from(buffer, position)
+            end = position + _LENGTH_PREFIX.size + length
+            if end > len(buffer):
+                break
+            try:
+                records.append(tuple(json.loads(buffer[position + _LENGTH_PREFIX.size:end])))
+            except ValueError as e:
+                print(f"Error decoding log record: {e}")
+            position = end
+        buffers[connection] = buffer[position:]
@@ -0,0 +1,80 @@
+import re
+from typing import Optional, Dict, Pattern
+
+from .config import LogLevel, LogMessage
+from .formatter import SimpleFormatter
+
+
+DEFAULT_LOG_FORMAT = SimpleFormatter().format_string
+
+
+class LogParser:
+    _FIELD_PATTERNS = {
+        "levelname": r"[A-Z]+",
+        "levelno": r"\d+",
+        "thread": r"\d+",
+    }
+    _BUILTIN_FIELDS = ("asctime", "levelname", "levelno", "module", "message")
+
+    def __init__(self, format_string: str = DEFAULT_LOG_FORMAT):
+        self.format_string = format_string
+        self.pattern = self._Compile(format_string)
+        self.fields = list(self.pattern.groupindex)
+        if "levelname" not in self.fields and "levelno" not in self.fields:
+            raise ValueError("log_format must contain %(levelname)s or %(levelno)s to be parsed")
+
+    def _Compile(self, format_string: str) -> Pattern:
+        placeholders = list(re.finditer(r"%\((\w+)\)s", format_string))
+        parts = ["^"]
+        seen = set()
+        position = 0
+
+        for index, match in enumerate(placeholders):
+            parts.append(re.escape(format_string[position:match.start()]))
+            name = match.group(1)
+            if name in seen:
+                parts.append(f"(?P={name})")
+            else:
+                seen.add(name)
+                is_last = index == len(placeholders) - 1 and match.end() == len(format_string)
+                field_pattern = r"[^\r\n]*" if is_last else self._FIELD_PATTERNS.get(name, ".*?")
+                parts.append(f"(?P<{name}>{field_pattern})")
+            position = match.end()
+
+        parts.append(re.escape(format_string[position:]))
+        parts.append(r"\r?$")
+        return re.compile("".join(parts), re.MULTILINE)
+
+    def Parse_Fields(self, line: str) -> Optional[Dict[str, str]]:
+        match = self.pattern.match(line.rstrip("\r\n"))
+        if match is None:
+            return None
+        return match.groupdict()
+
+    def Parse_Level(self, fields: Dict[str, str]) -> Optional[LogLevel]:
+        try:
+            if "levelname" in fields:
+                return LogLevel[fields["levelname"]]
+            return LogLevel(int(fields["levelno"]))
+        except (KeyError, ValueError):
+            return None
+
+    def Parse_Line(self, line: str) -> Optional[LogMessage]:
+        fields = self.Parse_Fields(line)
+        if fields is None:
+            return None
+
+        level = self.Parse_Level(fields)
+        if level is None:
+            return None
+
+        extra_fields = {key: value for key, value in fields.items()
+                        if key not in self._BUILTIN_FIELDS}
+
+        return LogMessage(
+            level=level,
+            message=fields.get("message", ""),
+            module_name=fields.get("module", "unknown"),
+            timestamp=fields.get("asctime", ""),
+            extra_fields=extra_fields
+        )
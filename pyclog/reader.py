@@ -0,0 +1,392 @@
+import ctypes
+import ctypes.util
+import json
+import os
+import select
+import sys
+import time
+from datetime import datetime
+from typing import Optional, Iterator, Tuple
+
+from .config import LogConfig, LogMessage
+from .parser import LogParser
+
+
+class _Poll_Waiter:
+    def __init__(self, min_interval: float, max_interval: float):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self._interval = min_interval
+
+    def Wait(self) -> None:
+        time.sleep(self._interval)
+        self._interval = min(self._interval * 2, self.max_interval)
+
+    def Notify_Activity(self) -> None:
+        self._interval = self.min_interval
+
+    def Close(self) -> None:
+        pass
+
+
+class _Inotify_Waiter:
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+    def __init__(self, directory: str, max_interval: float):
+        self.max_interval = max_interval
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+
+        self._fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+
+        watch = libc.inotify_add_watch(self._fd, os.fsencode(directory), self.WATCH_MASK)
+        if watch < 0:
+            errno = ctypes.get_errno()
+            os.close(self._fd)
+            raise OSError(errno, os.strerror(errno))
+
+    def Wait(self) -> None:
+        readable, _, _ = select.select([self._fd], [], [], self.max_interval)
+        if not readable:
+            return
+        while True:
+            try:
+                if not os.read(self._fd, 64 * 1024):
+                    break
+            except BlockingIOError:
+                break
+
+    def Notify_Activity(self) -> None:
+        pass
+
+    def Close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def _Create_Waiter(directory: str, min_interval: float, max_interval: float):
+    if sys.platform.startswith("linux"):
+        try:
+            return _Inotify_Waiter(directory, max_interval)
+        except (OSError, AttributeError, TypeError):
+            pass
+    return _Poll_Waiter(min_interval, max_interval)
+
+
+class LogReader:
+    def __init__(self, config: LogConfig,
+                 parser: Optional[LogParser] = None,
+                 checkpoint_path: Optional[str] = None,
+                 checkpoint_interval: float = 1.0,
+                 min_poll_interval: float = 0.05,
+                 max_poll_interval: float = 1.0,
+                 use_inotify: bool = True,
+                 read_size: int = 64 * 1024):
+        self.config = config
+        self.parser = parser
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_interval = checkpoint_interval
+        self.min_poll_interval = min_poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.use_inotify = use_inotify
+        self.read_size = read_size
+        self.resumed = False
+
+        self._file = None
+        self._path: Optional[str] = None
+        self._base_path: Optional[str] = None
+        self._file_id: Optional[Tuple[int, int]] = None
+        self._offset = 0
+        self._buffer = b""
+        self._last_checkpoint = time.monotonic()
+        self._waiter = None
+
+        if checkpoint_path:
+            self.resumed = self._Load_Checkpoint()
+
+    def Read(self, follow: bool = False) -> Iterator[LogMessage]:
+        if self.parser is None:
+            self.parser = LogParser()
+        for line in self.Read_Lines(follow):
+            message = self.parser.Parse_Line(line)
+            if message is not None:
+                yield message
+
+    def Read_Lines(self, follow: bool = False) -> Iterator[str]:
+        try:
+            while True:
+                if self._file is None:
+                    self._Open_Current()
+
+                yield from self._Read_Available()
+
+                rotated = yield from self._Handle_Rotation()
+                if rotated:
+                    continue
+
+                self._Maybe_Save_Checkpoint()
+                if not follow:
+                    break
+                self._Wait()
+        finally:
+            if self.checkpoint_path:
+                self.Save_Checkpoint()
+
+    def Seek_Last_Lines(self, count: int) -> None:
+        if self._file is None:
+            self._Open_Current()
+        if self._file is None:
+            return
+
+        size = os.fstat(self._file.fileno()).st_size
+        if count <= 0:
+            self._Seek(size)
+            return
+
+        position = size
+        if size > 0:
+            self._file.seek(size - 1)
+            if self._file.read(1) == b"\n":
+                position -= 1
+
+        found = 0
+        while position > 0:
+            block_start = max(0, position - self.read_size)
+            self._file.seek(block_start)
+            block = self._file.read(position - block_start)
+            index = block.rfind(b"\n")
+            while index != -1:
+                found += 1
+                if found == count:
+                    self._Seek(block_start + index + 1)
+                    return
+                index = block.rfind(b"\n", 0, index)
+            position = block_start
+
+        self._Seek(0)
+
+    def Save_Checkpoint(self) -> None:
+        if not self.checkpoint_path or self._path is None:
+            return
+        state = {
+            "path": self._path,
+            "base_path": self._base_path,
+            "device": self._file_id[0],
+            "inode": self._file_id[1],
+            "offset": self._offset,
+        }
+        try:
+            temp_path = f"{self.checkpoint_path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(state, f)
+            os.replace(temp_path, self.checkpoint_path)
+            self._last_checkpoint = time.monotonic()
+        except Exception as e:
+            print(f"Error saving checkpoint: {e}")
+
+    def Close(self) -> None:
+        if self.checkpoint_path:
+            self.Save_Checkpoint()
+        self._Close_File()
+        if self._waiter is not None:
+            self._waiter.Close()
+            self._waiter = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.Close()
+        return False
+
+    def _Get_Current_File_Path(self) -> str:
+        if self.config.enable_date_rotation:
+            date_str = datetime.now().strftime(self.config.date_format)
+            base_name, extension = os.path.splitext(self.config.log_file_path)
+            return f"{base_name}_{date_str}{extension}"
+        return self.config.log_file_path
+
+    def _Load_Checkpoint(self) -> bool:
+        try:
+            with open(self.checkpoint_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            base_path = str(state.get("base_path") or state["path"])
+            file_id = (int(state["device"]), int(state["inode"]))
+            offset = int(state["offset"])
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            print(f"Error loading checkpoint: {e!r}")
+            return False
+
+        index = self._Find_Rotated(base_path, file_id)
+        if index is None:
+            return False
+
+        path = self._Get_Backup_Path(base_path, index)
+        if offset < 0 or os.path.getsize(path) < offset:
+            return False
+
+        self._base_path = base_path
+        self._Open(path, offset)
+        return self._file is not None
+
+    def _Get_Backup_Path(self, base_path: str, index: int) -> str:
+        return base_path if index == 0 else f"{base_path}.{index}"
+
+    def _Find_Rotated(self, base_path: str, file_id: Tuple[int, int]) -> Optional[int]:
+        for index in range(0, self.config.backup_count + 1):
+            try:
+                stat = os.stat(self._Get_Backup_Path(base_path, index))
+            except OSError:
+                continue
+            if (stat.st_dev, stat.st_ino) == file_id:
+                return index
+        return None
+
+    def _Open_Current(self) -> None:
+        self._base_path = self._Get_Current_File_Path()
+        self._Open(self._base_path, 0)
+
+    def _Open(self, path: str, offset: int) -> None:
+        try:
+            file = open(path, 'rb')
+        except FileNotFoundError:
+            self._Close_File()
+            return
+        self._Adopt(path, file, offset)
+
+    def _Adopt(self, path, file, offset: int) -> None:
+        self._Close_File()
+        stat = os.fstat(file.fileno())
+        self._file = file
+        self._path = path
+        self._file_id = (stat.st_dev, stat.st_ino)
+        self._Seek(offset)
+
+    def _Seek(self, offset: int) -> None:
+        self._file.seek(offset)
+        self._offset = offset
+        self._buffer = b""
+
+    def _Close_File(self) -> None:
+        if self._file is not None:
+            try:
+                self._file.close()
+            except Exception as e:
+                print(f"Error closing log file: {e}")
+            finally:
+                self._file = None
+
+    def _Read_Available(self) -> Iterator[str]:
+        if self._file is None:
+            return
+        while True:
+            chunk = self._file.read(self.read_size)
+            if not chunk:
+                return
+            if self._waiter is not None:
+                self._waiter.Notify_Activity()
+
+            lines = (self._buffer + chunk).split(b"\n")
+            self._buffer = lines.pop()
+            for line in lines:
+                self._offset += len(line) + 1
+                yield self._Decode(line)
+
+    def _Drain_Partial_Line(self) -> Iterator[str]:
+        if self._buffer:
+            line = self._buffer
+            self._offset += len(line)
+            self._buffer = b""
+            yield self._Decode(line)
+
+    def _Decode(self, line: bytes) -> str:
+        return line.rstrip(b"\r").decode(self.config.encoding, errors="replace")
+
+    def _Handle_Rotation(self):
+        if self._file is None:
+            return False
+
+        try:
+            stat = os.stat(self._base_path)
+        except FileNotFoundError:
+            stat = None
+
+        if stat is not None and (stat.st_dev, stat.st_ino) == self._file_id:
+            if stat.st_size < self._offset + len(self._buffer):
+                self._Seek(0)
+                return True
+
+            current_path = self._Get_Current_File_Path()
+            if current_path == self._base_path or not os.path.exists(current_path):
+                return False
+
+            yield from self._Read_Available()
+            yield from self._Drain_Partial_Line()
+            self._base_path = current_path
+            return self._Open_Oldest()
+
+        yield from self._Read_Available()
+        yield from self._Drain_Partial_Line()
+        return self._Open_Next()
+
+    def _Open_Next(self) -> bool:
+        while True:
+            index = self._Find_Rotated(self._base_path, self._file_id)
+            if index is None:
+                print(f"Error following log file: {self._path} was removed before it was fully read")
+                return self._Open_Oldest()
+            if index == 0:
+                return False
+
+            path = self._Get_Backup_Path(self._base_path, index - 1)
+            try:
+                file = open(path, 'rb')
+            except FileNotFoundError:
+                return False
+
+            if self._Find_Rotated(self._base_path, self._file_id) == index:
+                self._Adopt(path, file, 0)
+                self._Save_Switch_Checkpoint()
+                return True
+            file.close()
+
+    def _Open_Oldest(self) -> bool:
+        for index in range(self.config.backup_count, -1, -1):
+            path = self._Get_Backup_Path(self._base_path, index)
+            try:
+                file = open(path, 'rb')
+            except FileNotFoundError:
+                continue
+            self._Adopt(path, file, 0)
+            self._Save_Switch_Checkpoint()
+            return True
+        self._Close_File()
+        return False
+
+    def _Save_Switch_Checkpoint(self) -> None:
+        if self.checkpoint_path:
+            self.Save_Checkpoint()
+
+    def _Maybe_Save_Checkpoint(self) -> None:
+        if self.checkpoint_path and time.monotonic() - self._last_checkpoint >= self.checkpoint_interval:
+            self.Save_Checkpoint()
+
+    def _Wait(self) -> None:
+        if self._waiter is None:
+            directory = os.path.dirname(os.path.abspath(self._Get_Current_File_Path()))
+            if self.use_inotify:
+                self._waiter = _Create_Waiter(directory, self.min_poll_interval, self.max_poll_interval)
+            else:
+                self._waiter = _Poll_Waiter(self.min_poll_interval, self.max_poll_interval)
+        self._waiter.Wait()
@@ -0,0 +1,198 @@
+import glob
+import mmap
+import os
+import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional, List, Tuple, Dict, Any
+
+from .config import LogConfig, LogLevel, DEFAULT_CONFIG
+from .parser import LogParser, DEFAULT_LOG_FORMAT
+
+
+DEFAULT_CHUNK_SIZE = 16 * 1024 * 1024
+MIN_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass
+class LogStats:
+    files: int = 0
+    bytes: int = 0
+    total_lines: int = 0
+    parsed_lines: int = 0
+    levels: Counter = field(default_factory=Counter)
+    modules: Counter = field(default_factory=Counter)
+    messages: Counter = field(default_factory=Counter)
+
+    @property
+    def unparsed_lines(self) -> int:
+        return self.total_lines - self.parsed_lines
+
+    def Merge(self, other: "LogStats") -> "LogStats":
+        self.files += other.files
+        self.bytes += other.bytes
+        self.total_lines += other.total_lines
+        self.parsed_lines += other.parsed_lines
+        self.levels.update(other.levels)
+        self.modules.update(other.modules)
+        self.messages.update(other.messages)
+        return self
+
+    def To_Dict(self, top: int = 10) -> Dict[str, Any]:
+        return {
+            "files": self.files,
+            "bytes": self.bytes,
+            "total_lines": self.total_lines,
+            "parsed_lines": self.parsed_lines,
+            "unparsed_lines": self.unparsed_lines,
+            "levels": {level.name: self.levels.get(level.name, 0) for level in LogLevel},
+            "modules": dict(self.modules.most_common()),
+            "top_messages": [
+                {"message": message, "count": count}
+                for message, count in self.messages.most_common(top)
+            ],
+        }
+
+
+def Discover_Log_Files(config: LogConfig,
+                       since: Optional[datetime] = None,
+                       until: Optional[datetime] = None) -> List[str]:
+    base_name, extension = os.path.splitext(config.log_file_path)
+    dated_pattern = re.compile(
+        re.escape(base_name) + r"_(.+)" + re.escape(extension) + r"(?:\.(\d+))?$"
+    )
+    plain_pattern = re.compile(re.escape(config.log_file_path) + r"(?:\.(\d+))?$")
+
+    candidates = glob.glob(glob.escape(base_name) + "_*")
+    if since is None and until is None:
+        candidates += glob.glob(glob.escape(config.log_file_path) + "*")
+
+    files = []
+    for path in set(candidates):
+        if not os.path.isfile(path):
+            continue
+
+        match = dated_pattern.match(path)
+        if match:
+            try:
+                date = datetime.strptime(match.group(1), config.date_format)
+            except ValueError:
+                match = None
+            else:
+                if since is not None and date < since:
+                    continue
+                if until is not None and date > until:
+                    continue
+                files.append(((1, date, -int(match.group(2) or 0)), path))
+                continue
+
+        match = plain_pattern.match(path)
+        if match:
+            files.append(((0, datetime.min, -int(match.group(1) or 0)), path))
+
+    return [path for _, path in sorted(files)]
+
+
+def Split_File_Ranges(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> List[Tuple[str, int, int]]:
+    size = os.path.getsize(path)
+    return [(path, start, min(start + chunk_size, size)) for start in range(0, size, chunk_size)]
+
+
+_parser_cache: Dict[str, LogParser] = {}
+
+
+def _Get_Parser(format_string: str) -> LogParser:
+    parser = _parser_cache.get(format_string)
+    if parser is None:
+        parser = _parser_cache[format_string] = LogParser(format_string)
+    return parser
+
+
+def _Align_Range(data: mmap.mmap, start: int, end: int) -> Tuple[int, int]:
+    size = len(data)
+
+    if start > 0 and data[start - 1:start] != b"\n":
+        newline = data.find(b"\n", start)
+        start = size if newline == -1 else newline + 1
+
+    if end < size and data[end - 1:end] != b"\n":
+        newline = data.find(b"\n", end)
+        end = size if newline == -1 else newline + 1
+
+    return start, end
+
+
+def _Analyze_Range(task: Tuple[str, int, int, str, str]) -> LogStats:
+    path, start, end, format_string, encoding = task
+    parser = _Get_Parser(format_string)
+    stats = LogStats()
+
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return stats
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            start, end = _Align_Range(data, start, end)
+            if start >= end:
+                return stats
+            text = data[start:end].decode(encoding, errors="replace")
+
+    stats.bytes = end - start
+    stats.total_lines = text.count("\n") + (0 if text.endswith("\n") else 1)
+
+    level_field = "levelname" if "levelname" in parser.fields else "levelno"
+    has_module = "module" in parser.fields
+    has_message = "message" in parser.fields
+    level_names: Dict[str, Optional[str]] = {}
+    levels = stats.levels
+    modules = stats.modules
+    messages = stats.messages
+
+    for match in parser.pattern.finditer(text):
+        level_text = match.group(level_field)
+        if level_text not in level_names:
+            level = parser.Parse_Level({level_field: level_text})
+            level_names[level_text] = level.name if level is not None else None
+        level_name = level_names[level_text]
+        if level_name is None:
+            continue
+        stats.parsed_lines += 1
+        levels[level_name] += 1
+        if has_module:
+            modules[match.group("module")] += 1
+        if has_message:
+            messages[match.group("message")] += 1
+
+    return stats
+
+
+def Analyze_Logs(paths: List[str],
+                 format_string: str = DEFAULT_LOG_FORMAT,
+                 encoding: str = DEFAULT_CONFIG.encoding,
+                 workers: Optional[int] = None,
+                 chunk_size: Optional[int] = None) -> LogStats:
+    _Get_Parser(format_string)
+    workers = workers or os.cpu_count() or 1
+
+    if chunk_size is None:
+        total_size = sum(os.path.getsize(path) for path in paths)
+        chunk_size = max(MIN_CHUNK_SIZE, min(DEFAULT_CHUNK_SIZE, total_size // (workers * 4) + 1))
+
+    tasks = [
+        (file_path, start, end, format_string, encoding)
+        for path in paths
+        for file_path, start, end in Split_File_Ranges(path, chunk_size)
+    ]
+
+    result = LogStats(files=len(paths))
+    if workers == 1 or len(tasks) <= 1:
+        for task in tasks:
+            result.Merge(_Analyze_Range(task))
+        return result
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as executor:
+        for partial in executor.map(_Analyze_Range, tasks):
+            result.Merge(partial)
+
+    return result
@@ -0,0 +1,23 @@
+import pytest
+
+
+class MemoryHandler:
+    def __init__(self, formatter, level=None):
+        self.formatter = formatter
+        self.level = level
+        self.messages = []
+
+    def Write_Log(self, message: str) -> bool:
+        self.messages.append(message)
+        return True
+
+    def Flush(self) -> None:
+        pass
+
+    def Close(self) -> None:
+        pass
+
+
+@pytest.fixture
+def memory_handler():
+    return MemoryHandler
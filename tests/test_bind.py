@@ -0,0 +1,58 @@
+import json
+
+import pytest
+
+from pyclog import Pyclog, LogConfig, LogFormatter, JSONFormatter
+
+
+@pytest.fixture(params=["text", "json"])
+def logger(request, tmp_path, memory_handler):
+    if request.param == "text":
+        formatter = LogFormatter("%(levelname)s %(request_id)s %(tenant)s %(message)s %(x)s")
+    else:
+        formatter = JSONFormatter()
+    pyclog = Pyclog(LogConfig(log_file_path=str(tmp_path / "app.log")))
+    pyclog.Close()
+    pyclog.handlers = [memory_handler(formatter)]
+    return pyclog
+
+
+@pytest.mark.parametrize("context, message, extra_fields", [
+    ({"request_id": "r1", "tenant": "acme"}, "hello", {"x": 1}),
+    ({"request_id": "%(message)s", "tenant": "%(levelname)s"}, "hello", {}),
+    ({"request_id": "100%", "tenant": "acme"}, "hello", {}),
+    ({"request_id": "r1", "tenant": "acme"}, "%(request_id)s", {"x": "%(tenant)s"}),
+    ({"request_id": "r1", "tenant": "acme"}, "override", {"tenant": "other"}),
+])
+def test_bound_output_matches_unbound_output(logger, context, message, extra_fields):
+    logger.Info(message, **{**context, **extra_fields})
+    logger.Bind(**context).Info(message, **extra_fields)
+
+    unbound, bound = logger.handlers[0].messages
+    if isinstance(logger.handlers[0].formatter, JSONFormatter):
+        unbound, bound = json.loads(unbound), json.loads(bound)
+        unbound.pop("timestamp")
+        bound.pop("timestamp")
+    assert bound == unbound
+
+
+class UpperFormatter(LogFormatter):
+    def Format_Message(self, message):
+        return super().Format_Message(message).upper()
+
+
+def test_bound_output_uses_formatter_overrides(tmp_path, memory_handler):
+    logger = Pyclog(LogConfig(log_file_path=str(tmp_path / "app.log")))
+    logger.Close()
+    logger.handlers = [memory_handler(UpperFormatter("%(levelname)s %(rid)s %(message)s"))]
+
+    logger.Info("hello", rid="r1")
+    logger.Bind(rid="r1").Info("hello")
+
+    assert logger.handlers[0].messages == ["INFO R1 HELLO", "INFO R1 HELLO"]
+
+
+def test_bound_logger_shares_parent_state(logger):
+    bound = logger.Bind(request_id="r1")
+    assert bound._lock is logger._lock
+    assert bound._min_handler_value == logger._min_handler_value
@@ -0,0 +1,129 @@
+import json
+
+import pytest
+
+from pyclog import Pyclog, LogConfig, LogLevel, LogFormatter, JSONFormatter, ConsoleHandler
+
+
+class CountingFormatter(LogFormatter):
+    def __init__(self):
+        super().__init__("%(levelname)s %(message)s")
+        self.calls = 0
+
+    def Format_Message(self, message):
+        self.calls += 1
+        return super().Format_Message(message)
+
+
+@pytest.fixture
+def logger(tmp_path):
+    pyclog = Pyclog(LogConfig(log_file_path=str(tmp_path / "app.log")))
+    yield pyclog
+    pyclog.Close()
+
+
+def test_handler_level_changes_update_min_enabled_level(logger, memory_handler):
+    logger.handlers[0].Set_Level(LogLevel.WARNING)
+    assert logger.Get_Min_Enabled_Level() == LogLevel.WARNING
+    assert not logger.Info("dropped")
+
+    error_handler = memory_handler(LogFormatter("%(message)s"), LogLevel.ERROR)
+    logger.Add_Handler(error_handler)
+    assert logger.Get_Min_Enabled_Level() == LogLevel.WARNING
+
+    logger.handlers[0].Set_Level(LogLevel.CRITICAL)
+    assert logger.Get_Min_Enabled_Level() == LogLevel.ERROR
+
+    logger.Remove_Handler(error_handler)
+    assert logger.Get_Min_Enabled_Level() == LogLevel.CRITICAL
+
+    logger.handlers[0].Set_Level(None)
+    logger.Set_Log_Level(LogLevel.INFO)
+    assert logger.Get_Min_Enabled_Level() == LogLevel.INFO
+    assert not logger.Debug("dropped")
+
+
+def test_config_level_is_read_at_call_time(tmp_path, memory_handler):
+    config = LogConfig(log_file_path=str(tmp_path / "app.log"))
+    first, second = Pyclog(config), Pyclog(config)
+    first.Close()
+    second.Close()
+    first.handlers = [memory_handler(LogFormatter("%(message)s"))]
+    second.handlers = [memory_handler(LogFormatter("%(message)s"))]
+
+    first.config.min_log_level = LogLevel.ERROR
+    assert not first.Info("dropped")
+
+    first.Set_Log_Level(LogLevel.WARNING)
+    assert not second.Info("dropped")
+    assert second.Warning("kept")
+    assert second.handlers[0].messages == ["kept"]
+
+
+def test_appending_to_handlers_updates_min_enabled_level(logger):
+    logger.handlers[0].Set_Level(LogLevel.WARNING)
+    logger.handlers.append(ConsoleHandler(LogFormatter("%(message)s")))
+
+    assert logger.Get_Min_Enabled_Level() == LogLevel.DEBUG
+    assert logger.Info("kept")
+
+
+def test_bound_logger_follows_parent_level_changes(logger, memory_handler):
+    handler = memory_handler(LogFormatter("%(message)s %(request_id)s"))
+    logger.Close()
+    logger.handlers = [handler]
+    bound = logger.Bind(request_id="r1")
+
+    bound.Set_Log_Level(LogLevel.ERROR)
+    assert not bound.Warning("dropped")
+    assert bound.Error("kept")
+    assert handler.messages == ["kept r1"]
+
+
+def test_each_formatter_renders_once_and_only_when_accepted(logger, memory_handler):
+    shared_formatter = CountingFormatter()
+    error_formatter = CountingFormatter()
+    logger.Close()
+    logger.handlers = [
+        memory_handler(shared_formatter, LogLevel.INFO),
+        memory_handler(shared_formatter, LogLevel.INFO),
+        memory_handler(error_formatter, LogLevel.ERROR),
+    ]
+
+    assert not logger.Debug("dropped")
+    assert (shared_formatter.calls, error_formatter.calls) == (0, 0)
+
+    assert logger.Info("hello")
+    assert (shared_formatter.calls, error_formatter.calls) == (1, 0)
+
+    assert logger.Error("failed")
+    assert (shared_formatter.calls, error_formatter.calls) == (2, 1)
+    assert [handler.messages for handler in logger.handlers] == [
+        ["INFO hello", "ERROR failed"],
+        ["INFO hello", "ERROR failed"],
+        ["ERROR failed"],
+    ]
+
+
+def test_each_formatter_uses_its_own_time_format(logger, memory_handler):
+    text_handler = memory_handler(LogFormatter("%(asctime)s", time_format="%H:%M:%S"))
+    json_handler = memory_handler(JSONFormatter())
+    logger.Close()
+    logger.handlers = [text_handler, json_handler]
+
+    assert logger.Info("hello")
+
+    assert len(text_handler.messages[0]) == len("12:00:00")
+    timestamp = json.loads(json_handler.messages[0])["timestamp"]
+    assert timestamp[10] == "T" and len(timestamp) == len("2024-01-01T12:00:00")
+
+
+def test_json_formatter_as_logger_formatter(tmp_path):
+    log_path = tmp_path / "app.log"
+    with Pyclog(LogConfig(log_file_path=str(log_path)), JSONFormatter()) as logger:
+        assert logger.Info("hello", user="alice")
+        logger.Flush()
+
+    record = json.loads(log_path.read_text(encoding="utf-8"))
+    assert record["message"] == "hello"
+    assert record["user"] == "alice"
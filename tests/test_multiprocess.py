@@ -0,0 +1,69 @@
+import json
+import multiprocessing
+import threading
+
+import pytest
+
+from pyclog import Pyclog, LogConfig, LogListener, JSONFormatter
+
+
+def _Worker(client, worker_id: int) -> None:
+    for i in range(20):
+        client.Info(f"worker {worker_id} message {i}")
+
+
+@pytest.fixture(params=["queue", "unix"])
+def transport(request):
+    return request.param
+
+
+def test_records_from_worker_processes_reach_one_writer(tmp_path, transport):
+    log_path = tmp_path / "app.log"
+    logger = Pyclog(LogConfig(log_file_path=str(log_path)))
+
+    with LogListener(logger, transport=transport, address=str(tmp_path / "log.sock")) as listener:
+        client = listener.Get_Client()
+        workers = [multiprocessing.Process(target=_Worker, args=(client, worker_id))
+                   for worker_id in range(3)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+    logger.Close()
+
+    lines = log_path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 60
+    for worker_id in range(3):
+        assert sum(f"worker {worker_id} message" in line for line in lines) == 20
+
+
+def test_unserializable_extra_fields_behave_the_same_on_both_transports(tmp_path, transport):
+    log_path = tmp_path / "app.log"
+    logger = Pyclog(LogConfig(log_file_path=str(log_path)))
+    logger.handlers[0].formatter = JSONFormatter()
+
+    with LogListener(logger, transport=transport, address=str(tmp_path / "log.sock")) as listener:
+        client = listener.Get_Client()
+        assert client.Info("with lock", lock=threading.Lock(), items=(1, 2), count=3)
+    logger.Close()
+
+    lines = log_path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 1
+    assert '"lock": "<unlocked _thread.lock object' in lines[0]
+    assert '"items": [1, 2], "count": 3' in lines[0]
+
+
+def test_listener_formats_timestamps_per_handler(tmp_path, transport):
+    log_path = tmp_path / "app.log"
+    json_path = tmp_path / "app.json"
+    logger = Pyclog(LogConfig(log_file_path=str(log_path)))
+    logger.Create_Log_File(str(json_path), formatter=JSONFormatter())
+
+    with LogListener(logger, transport=transport, address=str(tmp_path / "log.sock")) as listener:
+        assert listener.Get_Client().Info("hello")
+    logger.Close()
+
+    text_line = log_path.read_text(encoding="utf-8").splitlines()[0]
+    timestamp = json.loads(json_path.read_text(encoding="utf-8"))["timestamp"]
+    assert text_line.startswith(f"[{timestamp.replace('T', ' ')}] INFO")
+    assert timestamp[10] == "T"
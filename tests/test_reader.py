@@ -0,0 +1,115 @@
+import glob
+import threading
+import time
+
+import pytest
+
+from pyclog import Pyclog, LogConfig, LogLevel, LogReader
+from pyclog.cli import main
+
+
+def _Write_Default_Log(log_path: str, count: int, **config_kwargs) -> None:
+    with Pyclog(LogConfig(log_file_path=log_path, **config_kwargs)) as logger:
+        for i in range(count):
+            if i % 10 == 9:
+                logger.Warning(f"warning {i}")
+            else:
+                logger.Info(f"line {i}")
+
+
+def test_read_parses_default_logger_output(tmp_path):
+    log_path = str(tmp_path / "app.log")
+    _Write_Default_Log(log_path, 20)
+
+    with LogReader(LogConfig(log_file_path=log_path)) as reader:
+        messages = list(reader.Read())
+
+    assert len(messages) == 20
+    assert messages[9].level == LogLevel.WARNING
+    assert messages[9].message == "warning 9"
+
+
+def test_tail_level_filter_on_default_logger_output(tmp_path, capsys):
+    log_path = str(tmp_path / "app.log")
+    _Write_Default_Log(log_path, 20)
+
+    assert main(["tail", log_path, "-n", "20", "--level", "WARNING"]) == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert [line.split(": ", 1)[1] for line in lines] == ["warning 9", "warning 19"]
+
+
+def test_raw_tail_does_not_need_a_parseable_format(tmp_path, capsys):
+    log_path = str(tmp_path / "app.log")
+    _Write_Default_Log(log_path, 5)
+
+    assert main(["tail", log_path, "-n", "2", "--format", "%(message)s"]) == 0
+    assert capsys.readouterr().out.splitlines()[-1].endswith("line 4")
+
+
+def test_malformed_checkpoint_starts_fresh(tmp_path, capsys):
+    log_path = str(tmp_path / "app.log")
+    checkpoint_path = tmp_path / "app.offset"
+    _Write_Default_Log(log_path, 3)
+
+    for content in ("{}", '{"path": "x", "device": "a", "inode": 1, "offset": 0}', "[1, 2]"):
+        checkpoint_path.write_text(content)
+        reader = LogReader(LogConfig(log_file_path=log_path), checkpoint_path=str(checkpoint_path))
+        assert not reader.resumed
+        assert len(list(reader.Read_Lines())) == 3
+        reader.Close()
+    assert "Error loading checkpoint" in capsys.readouterr().out
+
+
+def test_checkpoint_resumes_across_rotation(tmp_path):
+    log_path = str(tmp_path / "app.log")
+    checkpoint_path = str(tmp_path / "app.offset")
+    config = LogConfig(log_file_path=log_path, max_file_size=300, backup_count=50)
+
+    logger = Pyclog(config)
+    for i in range(5):
+        logger.Info(f"line {i}")
+
+    reader = LogReader(config, checkpoint_path=checkpoint_path)
+    first = [message.message for message in reader.Read()]
+    reader.Close()
+
+    for i in range(5, 60):
+        logger.Info(f"line {i}")
+    logger.Close()
+
+    reader = LogReader(config, checkpoint_path=checkpoint_path)
+    assert reader.resumed
+    rest = [message.message for message in reader.Read()]
+    reader.Close()
+
+    assert first + rest == [f"line {i}" for i in range(60)]
+
+
+@pytest.mark.parametrize("use_inotify", [True, False])
+def test_follow_reads_every_line_across_rotations(tmp_path, use_inotify):
+    log_path = str(tmp_path / "app.log")
+    config = LogConfig(log_file_path=log_path, max_file_size=2000, backup_count=50)
+    logger = Pyclog(config)
+
+    reader = LogReader(config, use_inotify=use_inotify, min_poll_interval=0.01, max_poll_interval=0.05)
+    reader.Seek_Last_Lines(0)
+    received = []
+
+    def Follow() -> None:
+        for message in reader.Read(follow=True):
+            received.append(message.message)
+            if len(received) == 2000:
+                return
+            if len(received) % 100 == 0:
+                time.sleep(0.01)
+
+    thread = threading.Thread(target=Follow, daemon=True)
+    thread.start()
+    for i in range(2000):
+        logger.Info(f"line {i}")
+    logger.Close()
+    thread.join(timeout=10)
+    reader.Close()
+
+    assert len(glob.glob(f"{log_path}.*")) > 5
+    assert received == [f"line {i}" for i in range(2000)]
@@ -0,0 +1,152 @@
+import os
+import socket
+import struct
+import threading
+import time
+
+import pytest
+
+from pyclog import SocketHandler, SimpleFormatter
+
+
+class StandInCollector:
+    def __init__(self, port: int = 0):
+        self.server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.server.bind(("127.0.0.1", port))
+        self.server.listen()
+        self.port = self.server.getsockname()[1]
+        self._data = []
+        self._lock = threading.Lock()
+        threading.Thread(target=self._Accept_Loop, daemon=True).start()
+
+    def _Accept_Loop(self) -> None:
+        while True:
+            try:
+                connection, _ = self.server.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._Receive, args=(connection,), daemon=True).start()
+
+    def _Receive(self, connection: socket.socket) -> None:
+        with connection:
+            while True:
+                data = connection.recv(65536)
+                if not data:
+                    return
+                with self._lock:
+                    self._data.append(data)
+
+    def Data(self) -> bytes:
+        with self._lock:
+            return b"".join(self._data)
+
+    def Wait_For_Lines(self, count: int, timeout: float = 5.0) -> list:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            lines = self.Data().splitlines()
+            if len(lines) >= count:
+                return lines
+            time.sleep(0.02)
+        return self.Data().splitlines()
+
+    def Close(self) -> None:
+        self.server.close()
+
+
+def _Free_Port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def collector():
+    server = StandInCollector()
+    yield server
+    server.Close()
+
+
+def test_tcp_newline_round_trip(collector):
+    handler = SocketHandler(SimpleFormatter(), "127.0.0.1", collector.port, batch_size=50)
+    for i in range(500):
+        assert handler.Write_Log(f"message {i}")
+    handler.Flush()
+    handler.Close()
+
+    lines = collector.Wait_For_Lines(500)
+    assert lines == [f"message {i}".encode() for i in range(500)]
+
+
+def test_tcp_length_framing_round_trip(collector):
+    handler = SocketHandler(SimpleFormatter(), "127.0.0.1", collector.port, framing="length")
+    messages = ["first", "multi\nline", "第三条"]
+    for message in messages:
+        handler.Write_Log(message)
+    handler.Close()
+
+    deadline = time.monotonic() + 5.0
+    records = []
+    while time.monotonic() < deadline and len(records) < len(messages):
+        data = collector.Data()
+        records = []
+        position = 0
+        while position + 4 <= len(data):
+            length, = struct.unpack_from("!I", data, position)
+            records.append(data[position + 4:position + 4 + length].decode("utf-8"))
+            position += 4 + length
+        time.sleep(0.02)
+
+    assert records == messages
+
+
+def test_collector_down_spools_and_replays(tmp_path):
+    port = _Free_Port()
+    spool_path = str(tmp_path / "spool.bin")
+    handler = SocketHandler(SimpleFormatter(), "127.0.0.1", port,
+                            spool_path=spool_path, flush_interval=0.05, max_backoff=0.1)
+
+    for i in range(20):
+        handler.Write_Log(f"spooled {i}")
+    handler.Flush()
+    assert os.path.getsize(spool_path) > 0
+
+    server = StandInCollector(port)
+    try:
+        handler.Write_Log("live")
+        lines = server.Wait_For_Lines(21)
+        handler.Close()
+
+        assert lines == [f"spooled {i}".encode() for i in range(20)] + [b"live"]
+        assert not os.path.exists(spool_path)
+    finally:
+        server.Close()
+
+
+@pytest.mark.parametrize("max_datagram_size", [1024, 200000])
+def test_oversized_udp_record_does_not_block_later_records(tmp_path, max_datagram_size):
+    receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    receiver.bind(("127.0.0.1", 0))
+    receiver.settimeout(1.0)
+    spool_path = str(tmp_path / "spool.bin")
+
+    handler = SocketHandler(SimpleFormatter(), "127.0.0.1", receiver.getsockname()[1],
+                            protocol="udp", spool_path=spool_path,
+                            max_datagram_size=max_datagram_size)
+    handler.Write_Log("x" * 70000)
+    for i in range(5):
+        handler.Write_Log(f"small {i}")
+    handler.Close()
+
+    lines = []
+    try:
+        while True:
+            lines.extend(receiver.recv(65536).splitlines())
+    except socket.timeout:
+        pass
+    finally:
+        receiver.close()
+
+    assert lines[-5:] == [f"small {i}".encode() for i in range(5)]
+    assert all(len(line) < max_datagram_size for line in lines)
+    assert not os.path.exists(spool_path)
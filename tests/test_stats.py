@@ -0,0 +1,67 @@
+from datetime import datetime
+
+import pytest
+
+from pyclog import Pyclog, LogConfig, LogLevel, LogMessage, SimpleFormatter, Discover_Log_Files, Analyze_Logs
+from pyclog.cli import main
+
+
+def test_default_format_parses_default_logger_output(tmp_path, capsys):
+    log_path = str(tmp_path / "app.log")
+    with Pyclog(LogConfig(log_file_path=log_path, max_file_size=500, backup_count=10)) as logger:
+        for i in range(50):
+            logger.Info(f"message {i % 5}")
+        logger.Error("failed")
+
+    paths = Discover_Log_Files(LogConfig(log_file_path=log_path))
+    assert len(paths) > 1
+
+    stats = Analyze_Logs(paths, workers=1)
+    assert stats.parsed_lines == stats.total_lines == 51
+    assert stats.levels["INFO"] == 50
+    assert stats.levels["ERROR"] == 1
+    assert stats.messages["message 0"] == 10
+
+    assert main(["stats", log_path, "--workers", "1"]) == 0
+    assert "parsed 51, unparsed 0" in capsys.readouterr().out
+
+
+DATES = ["2026-01-01", "2026-01-02", "2026-01-03"]
+
+
+@pytest.fixture
+def dated_logs(tmp_path):
+    config = LogConfig(log_file_path=str(tmp_path / "app.log"))
+    formatter = SimpleFormatter()
+    expected = []
+    for date in DATES:
+        for suffix in (".1", ""):
+            lines = []
+            for i in range(200):
+                level = LogLevel.ERROR if i % 7 == 0 else LogLevel.INFO
+                message = LogMessage(level, f"{date} 消息 {i % 13}", "app", f"{date} 12:00:00", {})
+                lines.append(formatter.Format_Message(message))
+            (tmp_path / f"app_{date}.log{suffix}").write_text("\n".join(lines) + "\n", encoding="utf-8")
+            expected.append(str(tmp_path / f"app_{date}.log{suffix}"))
+    return config, expected
+
+
+def test_discover_orders_dated_files_and_backups(dated_logs):
+    config, expected = dated_logs
+
+    assert Discover_Log_Files(config) == expected
+    assert Discover_Log_Files(config, since=datetime(2026, 1, 2)) == expected[2:]
+    assert Discover_Log_Files(config, until=datetime(2026, 1, 2)) == expected[:4]
+    assert Discover_Log_Files(config, since=datetime(2026, 1, 2), until=datetime(2026, 1, 2)) == expected[2:4]
+
+
+@pytest.mark.parametrize("chunk_size", [64, 997, 4096])
+def test_parallel_chunks_match_serial_result(dated_logs, chunk_size):
+    config, paths = dated_logs
+
+    serial = Analyze_Logs(paths, workers=1)
+    parallel = Analyze_Logs(paths, workers=2, chunk_size=chunk_size)
+
+    assert serial.total_lines == serial.parsed_lines == 1200
+    assert serial.levels["ERROR"] == 6 * 29
+    assert parallel == serial